@@ -22,6 +22,12 @@ class SplitDocumentPages:
     warnings: List[str]
 
 
+# Reading, QR/AR and first Writing page; page index 1 is ignored. The pipeline does
+# not read the writing page image, but SplitDocumentPages.writing_page_gray is filled
+# for image inputs too, so PDFs keep it for the same contract (one extra render).
+USED_PAGE_INDICES = (0, 2, 3)
+
+
 class MergedDocumentSplitter:
     """Splits a merged student scan into Reading, QR/AR, and Writing pages."""
 
@@ -31,7 +37,25 @@ class MergedDocumentSplitter:
         if suffix not in SUPPORTED_SCAN_EXTENSIONS:
             raise ValueError(f"Unsupported scan file type: {doc_path}")
 
-        pages = self._extract_pages_as_grayscale(doc_path)
+        writing_page_pdf: Optional[bytes] = None
+        pages: List[Optional[np.ndarray]]
+        if suffix == ".pdf":
+            fitz = self._import_fitz()
+            # Rasterize and export the writing pages from a single parse of the PDF.
+            with fitz.open(str(doc_path)) as pdf:
+                # Only the pages that are marked or returned are rasterized; the rest
+                # keep their slot so page positions and the page count are unchanged.
+                pages = [None] * pdf.page_count
+                for index in USED_PAGE_INDICES:
+                    if index < pdf.page_count:
+                        pages[index] = self._render_pdf_page(pdf.load_page(index))
+                if len(pages) >= 4:
+                    writing_page_pdf = self._extract_pdf_pages_from(pdf, start_page=3)
+        else:
+            pages = self._extract_pages_as_grayscale(doc_path)
+            if len(pages) >= 4:
+                writing_page_pdf = self._images_to_pdf_bytes(pages[3:])
+
         page_count = len(pages)
         if page_count < 3:
             raise ValueError(
@@ -43,14 +67,7 @@ class MergedDocumentSplitter:
         writing_page = pages[3] if page_count >= 4 else None
         warnings: List[str] = []
 
-        writing_page_pdf: Optional[bytes]
-        if page_count >= 4:
-            if suffix == ".pdf":
-                writing_page_pdf = self._extract_pdf_pages_from(pdf_path=doc_path, start_page=3)
-            else:
-                writing_page_pdf = self._images_to_pdf_bytes(pages[3:])
-        else:
-            writing_page_pdf = None
+        if writing_page_pdf is None:
             warnings.append(
                 "Writing page not found (only 3 pages supplied). A placeholder writing sheet will be generated."
             )
@@ -80,45 +97,36 @@ class MergedDocumentSplitter:
                     pages.append(np.array(frame.convert("L")))
             return pages
 
-        if suffix == ".pdf":
-            try:
-                import fitz  # type: ignore
-            except ImportError as exc:
-                raise RuntimeError("PDF input requires PyMuPDF (`pip install pymupdf`).") from exc
-
-            pages = []
-            with fitz.open(str(doc_path)) as pdf:
-                for page in pdf:
-                    pix = page.get_pixmap(dpi=220, alpha=False)
-                    arr = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
-                    if pix.n == 1:
-                        gray = arr
-                    else:
-                        gray = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
-                    pages.append(gray)
-            return pages
-
         raise ValueError(f"Unsupported merged scan format: {doc_path}")
 
     @staticmethod
-    def _extract_pdf_pages_from(pdf_path: Path, start_page: int) -> bytes:
+    def _import_fitz():
         try:
             import fitz  # type: ignore
         except ImportError as exc:
-            raise RuntimeError("PDF output requires PyMuPDF (`pip install pymupdf`).") from exc
-
-        with fitz.open(str(pdf_path)) as source_pdf:
-            if source_pdf.page_count <= start_page:
-                raise ValueError(
-                    f"Expected at least {start_page + 1} pages in merged PDF, found {source_pdf.page_count}."
-                )
-
-            output_pdf = fitz.open()
-            output_pdf.insert_pdf(source_pdf, from_page=start_page, to_page=source_pdf.page_count - 1)
-            try:
-                return output_pdf.tobytes(garbage=4, deflate=True)
-            finally:
-                output_pdf.close()
+            raise RuntimeError("PDF input requires PyMuPDF (`pip install pymupdf`).") from exc
+        return fitz
+
+    @staticmethod
+    def _render_pdf_page(page) -> np.ndarray:
+        pix = page.get_pixmap(dpi=220, alpha=False)
+        arr = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+        if pix.n == 1:
+            return arr
+        return cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+
+    def _extract_pdf_pages_from(self, source_pdf, start_page: int) -> bytes:
+        if source_pdf.page_count <= start_page:
+            raise ValueError(
+                f"Expected at least {start_page + 1} pages in merged PDF, found {source_pdf.page_count}."
+            )
+
+        output_pdf = self._import_fitz().open()
+        output_pdf.insert_pdf(source_pdf, from_page=start_page, to_page=source_pdf.page_count - 1)
+        try:
+            return output_pdf.tobytes(garbage=4, deflate=True)
+        finally:
+            output_pdf.close()
 
     @staticmethod
     def _images_to_pdf_bytes(images: List[np.ndarray]) -> bytes:
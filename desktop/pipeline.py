@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import csv
 import json
+import multiprocessing
+import os
 import re
+import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -19,6 +23,11 @@ from desktop.services.marker import SubjectResult
 
 
 SUPPORTED_SCAN_EXTENSIONS = {".pdf"}
+READING_TEMPLATE_FILENAME = "aset_reading_template.json"
+QRAR_TEMPLATE_FILENAME = "aset_qrar_template.json"
+# Each worker holds a full processor (OpenCV, templates, report assets), so the
+# default stays small regardless of how many cores the machine has.
+DEFAULT_MAX_WORKERS = 4
 SUPPORTED_ANSWER_KEY_EXTENSIONS = {".txt", ".csv"}
 QUESTIONS_PER_SUBJECT = 35
 
@@ -46,21 +55,37 @@ QR_LABEL_PATTERN = re.compile(r"^(?:Q|QR|QUANTITATIVE(?:REASONING)?)\s*0*(\d+)$"
 AR_LABEL_PATTERN = re.compile(r"^(?:AR|ABSTRACT(?:REASONING)?)\s*0*(\d+)$", flags=re.IGNORECASE)
 
 
-@dataclass
+def default_worker_count() -> int:
+    return min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchProcessorConfig:
+    """Everything needed to build a processor; worker processes rebuild theirs from it."""
+
+    repo_root: Path
+    reading_answer_key_path: Path
+    qr_answer_key_path: Path
+    ar_answer_key_path: Path
+    concept_mapping_path: Path
+    year_level: str = "year4_5"
+
+
+@dataclass(slots=True)
 class StudentInput:
     name: str
     writing_percent: Optional[float]
     skip_reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerKeyBundle:
     reading: List[str]
     qr: List[str]
     ar: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class StudentRunResult:
     name: str
     status: str
@@ -70,7 +95,7 @@ class StudentRunResult:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchRunSummary:
     output_dir: Path
     results: List[StudentRunResult]
@@ -78,17 +103,11 @@ class BatchRunSummary:
 
 
 class DesktopBatchProcessor:
-    def __init__(
-        self,
-        repo_root: Path,
-        reading_answer_key_path: Path,
-        qr_answer_key_path: Path,
-        ar_answer_key_path: Path,
-        concept_mapping_path: Path,
-        year_level: str = "year4_5",
-    ):
-        self.repo_root = Path(repo_root)
-        self.year_level = year_level
+    def __init__(self, config: BatchProcessorConfig, max_workers: Optional[int] = None):
+        self.config = config
+        self.max_workers = max_workers
+        self.repo_root = Path(config.repo_root)
+        self.year_level = config.year_level
         self.config_dir = self.repo_root / "config"
         self.splitter = MergedDocumentSplitter()
 
@@ -96,15 +115,22 @@ class DesktopBatchProcessor:
         self.annotator = AnnotatorService()
 
         self.answer_keys = AnswerKeyBundle(
-            reading=self._load_single_subject_answer_key(reading_answer_key_path, "reading"),
-            qr=self._load_single_subject_answer_key(qr_answer_key_path, "qr"),
-            ar=self._load_single_subject_answer_key(ar_answer_key_path, "ar"),
+            reading=self._load_single_subject_answer_key(config.reading_answer_key_path, "reading"),
+            qr=self._load_single_subject_answer_key(config.qr_answer_key_path, "qr"),
+            ar=self._load_single_subject_answer_key(config.ar_answer_key_path, "ar"),
         )
-        self.concept_mapping = self._load_concept_mapping(concept_mapping_path)
+        # Template-labelled keys are identical for every student, so build them once.
+        self.reading_key = {f"RC{i+1}": ans for i, ans in enumerate(self.answer_keys.reading)}
+        self.qrar_key: Dict[str, str] = {}
+        for i, ans in enumerate(self.answer_keys.qr):
+            self.qrar_key[f"QR{i+1}"] = ans
+        for i, ans in enumerate(self.answer_keys.ar):
+            self.qrar_key[f"AR{i+1}"] = ans
+        self.concept_mapping = self._load_concept_mapping(config.concept_mapping_path)
 
         self.analysis_service = AnalysisService(self.concept_mapping)
         self.docx_generator = DocxReportGenerator(
-            year_level=year_level,
+            year_level=config.year_level,
             concept_mapping=self.concept_mapping,
         )
 
@@ -635,15 +661,27 @@ class DesktopBatchProcessor:
             raise ValueError(f"No merged PDF files found in: {scans_path}")
         return sorted(files)
 
-    def _match_student_to_doc(self, student_name: str, docs: List[Path]) -> Optional[Path]:
-        if len(docs) == 1:
-            return docs[0]
+    def _index_docs(self, docs: List[Path]) -> Dict[str, List[Path]]:
+        index: Dict[str, List[Path]] = {}
+        for doc in docs:
+            index.setdefault(self._normalize_name(doc.stem), []).append(doc)
+        return index
+
+    def _match_student_to_doc(self, student_name: str, doc_index: Dict[str, List[Path]]) -> Optional[Path]:
+        if len(doc_index) == 1:
+            (only_docs,) = doc_index.values()
+            if len(only_docs) == 1:
+                return only_docs[0]
 
-        available = {doc: self._normalize_name(doc.stem) for doc in docs}
         target = self._normalize_name(student_name)
-        candidates = [doc for doc, stem in available.items() if stem == target]
+        candidates = doc_index.get(target, [])
         if not candidates:
-            candidates = [doc for doc, stem in available.items() if target in stem or stem in target]
+            candidates = [
+                doc
+                for stem, stem_docs in doc_index.items()
+                if target in stem or stem in target
+                for doc in stem_docs
+            ]
 
         if len(candidates) == 1:
             return candidates[0]
@@ -667,8 +705,6 @@ class DesktopBatchProcessor:
 
     @staticmethod
     def _create_missing_writing_pdf(student_name: str, source_doc: Path, page_count: int) -> bytes:
-        from io import BytesIO
-
         canvas = Image.new("RGB", (1654, 2339), color="white")
         draw = ImageDraw.Draw(canvas)
 
@@ -693,49 +729,184 @@ class DesktopBatchProcessor:
         return buffer.getvalue()
 
     @staticmethod
-    def _append_debug_log(log_path: Path, message: str) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def _append_debug_log(log_path: Path, message: str, timestamp: Optional[str] = None) -> None:
+        # Worker lines arrive later than they happened, so they carry their own stamp.
+        timestamp = timestamp or time.strftime("%Y-%m-%d %H:%M:%S")
         with log_path.open("a", encoding="utf-8") as handle:
             handle.write(f"[{timestamp}] {message}\n")
 
+    @staticmethod
+    def _skipped(name: str, notes: str, issue: Optional[str] = None) -> Tuple[StudentRunResult, str]:
+        """Build the Skipped result and its issue line; the issue defaults to "<name>: <notes>"."""
+        return StudentRunResult(name=name, status="Skipped", notes=notes), issue or f"{name}: {notes}"
+
     def _split_qr_ar_result(self, qrar_result: SubjectResult) -> Tuple[SubjectResult, SubjectResult]:
+        # The halves only feed scoring and analysis; the sheet image and template stay on
+        # qrar_result for annotation, so they are not referenced again here.
         qr_len = len(self.answer_keys.qr)
         ar_len = len(self.answer_keys.ar)
 
         qr_results = qrar_result.results[:qr_len]
         ar_results = qrar_result.results[qr_len : qr_len + ar_len]
 
-        qr_score = sum(1 for q in qr_results if q.is_correct)
-        ar_score = sum(1 for q in ar_results if q.is_correct)
+        qr_score = sum(q.is_correct for q in qr_results)
+        ar_score = sum(q.is_correct for q in ar_results)
 
+        shared = {"omr_response": qrar_result.omr_response, "marked_image": None}
         qr = SubjectResult(
             subject_name="Quantitative Reasoning",
             score=qr_score,
             total_questions=qr_len,
             results=qr_results,
-            omr_response=qrar_result.omr_response,
-            marked_image=qrar_result.marked_image,
-            template=qrar_result.template,
-            clean_image=getattr(qrar_result, "clean_image", None),
+            **shared,
         )
         ar = SubjectResult(
             subject_name="Abstract Reasoning",
             score=ar_score,
             total_questions=ar_len,
             results=ar_results,
-            omr_response=qrar_result.omr_response,
-            marked_image=qrar_result.marked_image,
-            template=qrar_result.template,
-            clean_image=getattr(qrar_result, "clean_image", None),
+            **shared,
         )
         return qr, ar
 
+    def _process_student(
+        self,
+        student: StudentInput,
+        source_doc: Path,
+        student_output_dir: Path,
+        student_file_stem: str,
+        log: Callable[[str], None],
+    ) -> Tuple[StudentRunResult, Optional[str]]:
+        """Mark one matched student and write their outputs; returns the result and any issue."""
+        log(f"Student '{student.name}' start. Source document: {source_doc}")
+
+        try:
+            split_pages = self.splitter.split_document(source_doc)
+            reading_page = split_pages.reading_page_gray
+            qrar_page = split_pages.qrar_page_gray
+            writing_pdf = split_pages.writing_page_pdf
+            log(f"Student '{student.name}' page_count={split_pages.page_count}")
+            for warning in split_pages.warnings:
+                log(f"Student '{student.name}' warning: {warning}")
+
+            if writing_pdf is None:
+                issue = (
+                    f"{student.name}: Missing writing page in merged PDF (only {split_pages.page_count} pages supplied)."
+                )
+                log(f"Student '{student.name}' skipped: {issue}")
+                return self._skipped(student.name, issue, issue)
+
+            # The raw page arrays and their PNG encodings are only inputs to marking, so
+            # each is released as soon as it has been consumed.
+            reading_bytes = self._encode_png_bytes(reading_page)
+            qrar_bytes = self._encode_png_bytes(qrar_page)
+            del split_pages, reading_page, qrar_page
+
+            reading_result = self.marking_service.process_single_subject(
+                subject_name="Reading",
+                image_bytes=reading_bytes,
+                answer_key=self.reading_key,
+                template_filename=READING_TEMPLATE_FILENAME,
+            )
+            del reading_bytes
+            qrar_result = self.marking_service.process_single_subject(
+                subject_name="QR/AR",
+                image_bytes=qrar_bytes,
+                answer_key=self.qrar_key,
+                template_filename=QRAR_TEMPLATE_FILENAME,
+            )
+            del qrar_bytes
+
+            qr_result, ar_result = self._split_qr_ar_result(qrar_result)
+
+            # Each annotated sheet is a full-resolution colour copy; write it out and drop it
+            # before building the next so only one is alive at a time.
+            reading_annotated = self.annotator.annotate_sheet(reading_result)
+            self._write_image_as_pdf(
+                reading_annotated,
+                student_output_dir / f"{student_file_stem}_reading.pdf",
+            )
+            del reading_annotated
+
+            qrar_annotated = self.annotator.annotate_sheet(
+                qrar_result,
+                include_score_overlay=False,
+            )
+            qrar_formatted = self.annotator.format_qrar_sections(
+                qrar_annotated,
+                qrar_result.template,
+                qr_score=qr_result.score,
+                qr_total=len(self.answer_keys.qr),
+                ar_score=ar_result.score,
+                ar_total=len(self.answer_keys.ar),
+            )
+            del qrar_annotated
+            self._write_image_as_pdf(
+                qrar_formatted,
+                student_output_dir / f"{student_file_stem}_qrar.pdf",
+            )
+            del qrar_formatted
+            (student_output_dir / f"{student_file_stem}_writing.pdf").write_bytes(writing_pdf)
+
+            analysis = self.analysis_service.generate_full_analysis(
+                reading_result,
+                qr_result,
+                ar_result,
+            )
+
+            student_payload = {
+                "name": student.name,
+                "writing_score": student.writing_percent,
+                "reading_score": reading_result.score,
+                "reading_total": len(self.answer_keys.reading),
+                "qr_score": qr_result.score,
+                "qr_total": len(self.answer_keys.qr),
+                "ar_score": ar_result.score,
+                "ar_total": len(self.answer_keys.ar),
+            }
+
+            report_bytes = self.docx_generator.generate_report_bytes(
+                student_data=student_payload,
+                flow_type="batch",
+                analysis=analysis,
+            )
+            (student_output_dir / f"{student_file_stem}_report.docx").write_bytes(report_bytes)
+
+            graph_bytes = self.docx_generator.generate_chart_bytes(
+                student_data=student_payload,
+                flow_type="batch",
+                analysis=analysis,
+            )
+            (student_output_dir / "performance_graph.png").write_bytes(graph_bytes)
+            log(
+                f"Student '{student.name}' success. "
+                f"Scores -> Reading={reading_result.score}, QR={qr_result.score}, AR={ar_result.score}"
+            )
+
+            return (
+                StudentRunResult(
+                    name=student.name,
+                    status="Success",
+                    reading_score=float(reading_result.score),
+                    qr_score=float(qr_result.score),
+                    ar_score=float(ar_result.score),
+                ),
+                None,
+            )
+        except Exception as exc:
+            trace = traceback.format_exc()
+            (student_output_dir / "debug_error.txt").write_text(trace, encoding="utf-8")
+            log(f"Student '{student.name}' error: {exc}\n{trace}")
+            return self._skipped(student.name, str(exc))
+
     def run(self, scans_path: Path, csv_path: Path, output_dir: Optional[Path] = None) -> BatchRunSummary:
         students = self.load_students_csv(csv_path)
         docs = self._collect_merged_docs(scans_path)
+        # Scans are indexed by normalized stem once per run, so an exact match is a dict lookup.
+        doc_index = self._index_docs(docs)
 
         if output_dir is None:
-            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            stamp = time.strftime("%Y%m%d_%H%M%S")
             output_dir = self.repo_root / "outputs" / f"desktop_run_{stamp}"
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -746,181 +917,106 @@ class DesktopBatchProcessor:
         self._append_debug_log(debug_log_path, f"Students in CSV: {len(students)}")
         self._append_debug_log(debug_log_path, f"Merged documents discovered: {len(docs)}")
 
-        results: List[StudentRunResult] = []
-        issues: List[str] = []
+        # Outcomes are slotted by CSV position so the summary keeps the input order.
+        outcomes: List[Optional[Tuple[StudentRunResult, Optional[str]]]] = [None] * len(students)
+        jobs = []
 
-        for student in students:
+        for index, student in enumerate(students):
             student_output_dir = output_dir / self._safe_student_folder(student.name)
             student_output_dir.mkdir(parents=True, exist_ok=True)
             student_file_stem = self._safe_student_file_stem(student.name)
 
             if student.skip_reason:
-                issue = f"{student.name}: {student.skip_reason}"
-                issues.append(issue)
                 self._append_debug_log(debug_log_path, f"Student '{student.name}' skipped: {student.skip_reason}")
-                results.append(StudentRunResult(name=student.name, status="Skipped", notes=student.skip_reason))
+                outcomes[index] = self._skipped(student.name, student.skip_reason)
                 continue
 
-            source_doc = self._match_student_to_doc(student.name, docs)
+            source_doc = self._match_student_to_doc(student.name, doc_index)
             if source_doc is None:
                 issue = (
                     f"{student.name}: Could not uniquely match merged scan for student. "
                     f"Ensure file names align with student names in CSV."
                 )
-                issues.append(issue)
                 self._append_debug_log(debug_log_path, f"Student '{student.name}' skipped: {issue}")
-                results.append(StudentRunResult(name=student.name, status="Skipped", notes=issue))
+                outcomes[index] = self._skipped(student.name, issue, issue)
                 continue
 
-            self._append_debug_log(
-                debug_log_path,
-                f"Student '{student.name}' start. Source document: {source_doc}",
-            )
-
-            try:
-                split_pages = self.splitter.split_document(source_doc)
-                reading_page = split_pages.reading_page_gray
-                qrar_page = split_pages.qrar_page_gray
-                writing_pdf = split_pages.writing_page_pdf
-                self._append_debug_log(
-                    debug_log_path,
-                    f"Student '{student.name}' page_count={split_pages.page_count}",
+            jobs.append((index, student, source_doc, student_output_dir, student_file_stem))
+
+        worker_count = 1
+        if len(jobs) > 1:
+            worker_count = min(self.max_workers or default_worker_count(), len(jobs))
+        if worker_count <= 1:
+            for index, student, source_doc, student_output_dir, student_file_stem in jobs:
+                outcomes[index] = self._process_student(
+                    student,
+                    source_doc,
+                    student_output_dir,
+                    student_file_stem,
+                    lambda message: self._append_debug_log(debug_log_path, message),
                 )
-                for warning in split_pages.warnings:
-                    self._append_debug_log(
-                        debug_log_path,
-                        f"Student '{student.name}' warning: {warning}",
-                    )
-
-                if writing_pdf is None:
-                    issue = (
-                        f"{student.name}: Missing writing page in merged PDF (only {split_pages.page_count} pages supplied)."
-                    )
-                    issues.append(issue)
-                    self._append_debug_log(
-                        debug_log_path,
-                        f"Student '{student.name}' skipped: {issue}",
+        else:
+            self._append_debug_log(debug_log_path, f"Marking {len(jobs)} students across {worker_count} processes.")
+            # Spawned workers start clean on every platform; forking the GUI's
+            # multi-threaded process is not safe.
+            with ProcessPoolExecutor(
+                max_workers=worker_count,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.config,),
+            ) as executor:
+                futures = {}
+                for index, student, source_doc, student_output_dir, student_file_stem in jobs:
+                    future = executor.submit(
+                        _process_student_in_worker,
+                        student,
+                        source_doc,
+                        student_output_dir,
+                        student_file_stem,
                     )
-                    results.append(StudentRunResult(name=student.name, status="Skipped", notes=issue))
-                    continue
-
-                reading_bytes = self._encode_png_bytes(reading_page)
-                qrar_bytes = self._encode_png_bytes(qrar_page)
-
-                reading_key = {f"RC{i+1}": ans for i, ans in enumerate(self.answer_keys.reading)}
-                qrar_key: Dict[str, str] = {}
-                for i, ans in enumerate(self.answer_keys.qr):
-                    qrar_key[f"QR{i+1}"] = ans
-                for i, ans in enumerate(self.answer_keys.ar):
-                    qrar_key[f"AR{i+1}"] = ans
-
-                reading_result = self.marking_service.process_single_subject(
-                    subject_name="Reading",
-                    image_bytes=reading_bytes,
-                    answer_key=reading_key,
-                    template_filename="aset_reading_template.json",
-                )
-                qrar_result = self.marking_service.process_single_subject(
-                    subject_name="QR/AR",
-                    image_bytes=qrar_bytes,
-                    answer_key=qrar_key,
-                    template_filename="aset_qrar_template.json",
-                )
-
-                qr_result, ar_result = self._split_qr_ar_result(qrar_result)
-
-                reading_annotated = self.annotator.annotate_sheet(reading_result)
-                qrar_annotated = self.annotator.annotate_sheet(
-                    qrar_result,
-                    include_score_overlay=False,
-                )
-                qrar_formatted = self.annotator.format_qrar_sections(
-                    qrar_annotated,
-                    qrar_result.template,
-                    qr_score=qr_result.score,
-                    qr_total=len(self.answer_keys.qr),
-                    ar_score=ar_result.score,
-                    ar_total=len(self.answer_keys.ar),
-                )
-
-                self._write_image_as_pdf(
-                    reading_annotated,
-                    student_output_dir / f"{student_file_stem}_reading.pdf",
-                )
-                self._write_image_as_pdf(
-                    qrar_formatted,
-                    student_output_dir / f"{student_file_stem}_qrar.pdf",
-                )
-                (student_output_dir / f"{student_file_stem}_writing.pdf").write_bytes(writing_pdf)
-
-                analysis = self.analysis_service.generate_full_analysis(
-                    reading_result,
-                    qr_result,
-                    ar_result,
-                )
-
-                student_payload = {
-                    "name": student.name,
-                    "writing_score": student.writing_percent,
-                    "reading_score": reading_result.score,
-                    "reading_total": len(self.answer_keys.reading),
-                    "qr_score": qr_result.score,
-                    "qr_total": len(self.answer_keys.qr),
-                    "ar_score": ar_result.score,
-                    "ar_total": len(self.answer_keys.ar),
-                }
-
-                report_bytes = self.docx_generator.generate_report_bytes(
-                    student_data=student_payload,
-                    flow_type="batch",
-                    analysis=analysis,
-                )
-                (student_output_dir / f"{student_file_stem}_report.docx").write_bytes(report_bytes)
-
-                graph_bytes = self.docx_generator.generate_chart_bytes(
-                    student_data=student_payload,
-                    flow_type="batch",
-                    analysis=analysis,
-                )
-                (student_output_dir / "performance_graph.png").write_bytes(graph_bytes)
-                self._append_debug_log(
-                    debug_log_path,
-                    (
-                        f"Student '{student.name}' success. "
-                        f"Scores -> Reading={reading_result.score}, QR={qr_result.score}, AR={ar_result.score}"
-                    ),
-                )
+                    # Worker lines only reach the log once a student finishes, so record
+                    # the hand-off here; a hung run still shows who was in flight.
+                    self._append_debug_log(debug_log_path, f"Student '{student.name}' queued for marking.")
+                    futures[future] = (index, student, student_output_dir)
+                # Collect in completion order so one slow sheet never holds back the log
+                # for students that already finished; the slot index keeps the CSV order.
+                for future in as_completed(futures):
+                    index, student, student_output_dir = futures[future]
+                    try:
+                        result, issue, messages = future.result()
+                    except Exception as exc:
+                        # The worker itself died; the student's own errors are caught inside it.
+                        trace = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+                        (student_output_dir / "debug_error.txt").write_text(trace, encoding="utf-8")
+                        result, issue = self._skipped(student.name, str(exc))
+                        self._append_debug_log(debug_log_path, f"Student '{student.name}' error: {exc}\n{trace}")
+                        messages = []
+                    for timestamp, message in messages:
+                        self._append_debug_log(debug_log_path, message, timestamp)
+                    outcomes[index] = (result, issue)
 
-                results.append(
-                    StudentRunResult(
-                        name=student.name,
-                        status="Success",
-                        reading_score=float(reading_result.score),
-                        qr_score=float(qr_result.score),
-                        ar_score=float(ar_result.score),
-                    )
-                )
-            except Exception as exc:
-                issue = f"{student.name}: {exc}"
+        results: List[StudentRunResult] = []
+        issues: List[str] = []
+        success_count = 0
+        for student, outcome in zip(students, outcomes):
+            if outcome is None:
+                outcome = self._skipped(student.name, "Student was not processed.")
+            result, issue = outcome
+            results.append(result)
+            if issue:
                 issues.append(issue)
-                trace = traceback.format_exc()
-                (student_output_dir / "debug_error.txt").write_text(trace, encoding="utf-8")
-                self._append_debug_log(
-                    debug_log_path,
-                    f"Student '{student.name}' error: {exc}\n{trace}",
-                )
-                results.append(StudentRunResult(name=student.name, status="Skipped", notes=str(exc)))
+            if result.status == "Success":
+                success_count += 1
 
         summary_path = output_dir / "batch_summary.csv"
         with summary_path.open("w", encoding="utf-8", newline="") as handle:
             writer = csv.writer(handle)
             writer.writerow(["Student Name", "Status", "Reading Score", "QR Score", "AR Score", "Notes"])
-            for item in results:
-                writer.writerow(
-                    [item.name, item.status, item.reading_score, item.qr_score, item.ar_score, item.notes]
-                )
+            writer.writerows(
+                (item.name, item.status, item.reading_score, item.qr_score, item.ar_score, item.notes)
+                for item in results
+            )
 
-        success_count = sum(1 for item in results if item.status == "Success")
         failure_count = len(results) - success_count
         self._append_debug_log(
             debug_log_path,
@@ -928,3 +1024,33 @@ class DesktopBatchProcessor:
         )
 
         return BatchRunSummary(output_dir=output_dir, results=results, issues=issues)
+
+
+# Each worker process builds its own processor once and reuses it for every student it marks.
+_worker_processor: Optional[DesktopBatchProcessor] = None
+
+
+def _init_worker(config: BatchProcessorConfig) -> None:
+    global _worker_processor
+    _worker_processor = DesktopBatchProcessor(config)
+    # Workers exist only to mark, so load the templates before the first student arrives.
+    _worker_processor.marking_service.preload_templates(READING_TEMPLATE_FILENAME, QRAR_TEMPLATE_FILENAME)
+
+
+def _process_student_in_worker(
+    student: StudentInput,
+    source_doc: Path,
+    student_output_dir: Path,
+    student_file_stem: str,
+) -> Tuple[StudentRunResult, Optional[str], List[Tuple[str, str]]]:
+    # Log lines are handed back to the parent so only one process writes debug_run.log;
+    # each keeps the time it was produced in the worker.
+    messages: List[Tuple[str, str]] = []
+    result, issue = _worker_processor._process_student(
+        student,
+        source_doc,
+        student_output_dir,
+        student_file_stem,
+        lambda message: messages.append((time.strftime("%Y-%m-%d %H:%M:%S"), message)),
+    )
+    return result, issue, messages
@@ -266,38 +266,11 @@ class AnnotatorService:
         # Step B: Build bubble index for fast lookup
         bubble_index = self._build_bubble_index(template)
         
-        # Step C: Draw feedback for QR questions
-        if result.qr:
-            qr_questions = self._get_questions(result.qr)
-            for question in qr_questions:
-                if question.is_correct:
-                    continue
-                
-                # Construct lookup key
-                label_key = str(question.label).lower()
-                value_key = str(question.correct_value).upper()
-                lookup_key = (label_key, value_key)
-                
-                bubble_data = bubble_index.get(lookup_key)
-                
-                if bubble_data:
-                    bubble, field_block = bubble_data
-                    x = bubble.x + field_block.shift
-                    y = bubble.y
-                    box_w, box_h = field_block.bubble_dimensions
-                    
-                    cv2.rectangle(
-                        img,
-                        (int(x + box_w / 12), int(y + box_h / 12)),
-                        (int(x + box_w - box_w / 12), int(y + box_h - box_h / 12)),
-                        CLR_RED,
-                        3
-                    )
-        
-        # Step C: Draw feedback for AR questions
-        if result.ar:
-            ar_questions = self._get_questions(result.ar)
-            for question in ar_questions:
+        # Step C: Draw feedback for QR and AR questions
+        for section in (result.qr, result.ar):
+            if not section:
+                continue
+            for question in self._get_questions(section):
                 if question.is_correct:
                     continue
                 
@@ -413,18 +413,7 @@ class CSVReportGenerator:
             area_results=None,
             flow_type=FlowType.MOCK,
         )
-        return [
-            {
-                "name": concept.name,
-                "questions": concept.questions,
-                "question_numbers": concept.questions,
-                "done_well": concept.done_well,
-                "improve": concept.improve,
-                "done_well_tick": concept.done_well,
-                "room_improve_tick": concept.improve,
-            }
-            for concept in concepts
-        ]
+        return [concept.to_context() for concept in concepts]
 
     def _build_template_context(self, student: PrecalculatedStudentRow) -> Dict[str, Any]:
         reading_concepts = self._build_empty_concept_rows(DEFAULT_READING_CONCEPTS, "Reading")
@@ -99,7 +99,7 @@ def _load_concept_question_mapping() -> Dict[str, Dict[str, str]]:
 CONCEPT_QUESTION_MAPPING = _load_concept_question_mapping()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConceptMastery:
     """Represents mastery status for a single concept."""
     name: str
@@ -115,6 +115,18 @@ class ConceptMastery:
             "improve": self.improve,
             "questions": self.questions,
         }
+    
+    def to_context(self) -> Dict[str, str]:
+        """Convert to the template row dict, including the legacy alias keys."""
+        return {
+            "name": self.name,
+            "questions": self.questions,
+            "question_numbers": self.questions,  # Alias
+            "done_well": self.done_well,
+            "improve": self.improve,
+            "done_well_tick": self.done_well,  # Alias
+            "room_improve_tick": self.improve,  # Alias
+        }
 
 
 @dataclass
@@ -527,30 +539,8 @@ class DocxReportGenerator:
         )
         
         # Convert to dicts with all fields including aliases
-        reading_concepts = [
-            {
-                "name": c.name,
-                "questions": c.questions,
-                "question_numbers": c.questions,  # Alias
-                "done_well": c.done_well,
-                "improve": c.improve,
-                "done_well_tick": c.done_well,  # Alias
-                "room_improve_tick": c.improve,  # Alias
-            }
-            for c in reading_concepts_objs
-        ]
-        qr_concepts = [
-            {
-                "name": c.name,
-                "questions": c.questions,
-                "question_numbers": c.questions,  # Alias
-                "done_well": c.done_well,
-                "improve": c.improve,
-                "done_well_tick": c.done_well,  # Alias
-                "room_improve_tick": c.improve,  # Alias
-            }
-            for c in qr_concepts_objs
-        ]
+        reading_concepts = [c.to_context() for c in reading_concepts_objs]
+        qr_concepts = [c.to_context() for c in qr_concepts_objs]
         
         return {
             "student_name": student_name,
@@ -656,18 +646,7 @@ class DocxReportGenerator:
             reading_concepts_objs = self._build_concept_mastery_list(
                 DEFAULT_READING_CONCEPTS, 'Reading', None, flow_type
             )
-            reading_concepts = [
-                {
-                    "name": c.name,
-                    "questions": c.questions,
-                    "question_numbers": c.questions,  # Alias
-                    "done_well": c.done_well,
-                    "improve": c.improve,
-                    "done_well_tick": c.done_well,  # Alias
-                    "room_improve_tick": c.improve,  # Alias
-                }
-                for c in reading_concepts_objs
-            ]
+            reading_concepts = [c.to_context() for c in reading_concepts_objs]
         
         if 'qr_concepts' in student_data and isinstance(student_data['qr_concepts'], list):
             qr_concepts = student_data['qr_concepts']
@@ -675,18 +654,7 @@ class DocxReportGenerator:
             qr_concepts_objs = self._build_concept_mastery_list(
                 DEFAULT_QR_CONCEPTS, 'Quantitative Reasoning', None, flow_type
             )
-            qr_concepts = [
-                {
-                    "name": c.name,
-                    "questions": c.questions,
-                    "question_numbers": c.questions,  # Alias
-                    "done_well": c.done_well,
-                    "improve": c.improve,
-                    "done_well_tick": c.done_well,  # Alias
-                    "room_improve_tick": c.improve,  # Alias
-                }
-                for c in qr_concepts_objs
-            ]
+            qr_concepts = [c.to_context() for c in qr_concepts_objs]
         
         return {
             "student_name": student_name,
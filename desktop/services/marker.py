@@ -1,4 +1,5 @@
 from __future__ import annotations
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -81,6 +82,12 @@ class MarkingService:
         self.config_dir = Path(config_dir)
         self.tuning_config = DotMap(CONFIG_DEFAULTS)
         self.tuning_config.outputs.save_image_level = 0  # Prevent disk writes
+        # Parsed templates by filename, reused for every sheet. With auto_align,
+        # read_omr_response sets field_block.shift on the shared template and
+        # AnnotatorService reads it back. That is safe only because the shift is
+        # recomputed for every sheet, and each sheet is annotated before the next
+        # one is marked with the same template.
+        self._templates: Dict[str, Template] = {}
 
 
     def _validate_image(self, image_bytes: bytes) -> None:
@@ -96,10 +103,19 @@ class MarkingService:
         return image
 
     def _load_template(self, template_filename: str) -> Template:
+        if template_filename in self._templates:
+            return self._templates[template_filename]
         template_path = self.config_dir / template_filename
         if not template_path.exists():
             raise FileNotFoundError(f"Template file not found: {template_path}")
-        return Template(template_path, self.tuning_config)
+        template = Template(template_path, self.tuning_config)
+        self._templates[template_filename] = template
+        return template
+
+    def preload_templates(self, *template_filenames: str) -> None:
+        """Parse the given templates now so the first sheet does not pay for it."""
+        for template_filename in template_filenames:
+            self._load_template(template_filename)
 
     def _run_omr_pipeline(self, image: np.ndarray, template: Template) -> Tuple[dict, np.ndarray, bool, Any, np.ndarray]:
         ops = ImageInstanceOps(self.tuning_config)
@@ -144,7 +160,6 @@ class MarkingService:
                 return clean_response[key]
         
         # Try extracting number and matching with different prefixes
-        import re
         match = re.search(r'(\d+)$', label)
         if match:
             num = match.group(1)
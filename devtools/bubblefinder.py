@@ -1,11 +1,39 @@
+import argparse
+
+from PIL import Image
+
+DEFAULT_IMAGE = "C:/Users/atuly/Documents/GitHub/OMRChecker/inputs/Reading/reading.png"
+
+argparser = argparse.ArgumentParser(description="Find bubble coordinates on a sheet image.")
+argparser.add_argument(
+    "images",
+    nargs="*",
+    default=[DEFAULT_IMAGE],
+    help="Paths to one or more sheet images, shown one after another.",
+)
+argparser.add_argument(
+    "-s",
+    "--size",
+    action="store_true",
+    help="Print the image dimensions and exit without decoding the pixels.",
+)
+args = argparser.parse_args()
+
+if args.size:
+    # Image.open only parses the header, so this never pays for a full decode
+    for image_path in args.images:
+        with Image.open(image_path) as header:
+            width, height = header.size
+        print(f"{image_path}: {width}x{height}")
+    raise SystemExit(0)
+
+# OpenCV is only needed for the interactive viewer, so --size works without it
 import cv2
 
-# Load image
-img = cv2.imread("C:/Users/atuly/Documents/GitHub/OMRChecker/inputs/Reading/reading.png")
-if img is None:
-    raise FileNotFoundError("Could not load image")
-
-clone = img.copy()
+# Current sheet and a scratch buffer for the drag preview, reused on every mouse move
+clone = None
+preview = None
+preview_rect = None    # (x0, y0, x1, y1) region of preview holding the last rectangle
 
 # Globals for rectangle drawing and zoom
 drawing = False
@@ -16,6 +44,39 @@ zoom_img = None
 zoom_origin = (0, 0)   # top left of zoomed region in original image
 zoom_factor = 3.0      # how much to zoom in
 
+
+def load_sheet(image_path):
+    """Swap the sheet shown in the existing windows for a new image."""
+    global clone, preview, preview_rect, drawing, zoom_img
+
+    img = cv2.imread(image_path)
+    if img is None:
+        raise FileNotFoundError(f"Could not load image: {image_path}")
+
+    clone = img
+    preview = clone.copy()
+    preview_rect = None
+    drawing = False
+    zoom_img = None
+    try:
+        cv2.destroyWindow("zoom")
+    except cv2.error:
+        pass
+
+    print(f"\nSheet: {image_path}")
+    cv2.imshow("sheet", clone)
+
+
+def restore_preview():
+    """Copy back only the region of the preview that the last rectangle touched."""
+    global preview_rect
+    if preview_rect is None:
+        return
+    x0, y0, x1, y1 = preview_rect
+    preview[y0:y1, x0:x1] = clone[y0:y1, x0:x1]
+    preview_rect = None
+
+
 def sheet_callback(event, x, y, flags, param):
     """
     Mouse callback for the main 'sheet' window.
@@ -23,7 +84,7 @@ def sheet_callback(event, x, y, flags, param):
       - click to print coordinates
       - click and drag to select a rectangle and open a zoomed view
     """
-    global drawing, rect_start, rect_end, clone, zoom_img, zoom_origin
+    global drawing, rect_start, rect_end, clone, preview, preview_rect, zoom_img, zoom_origin
 
     if event == cv2.EVENT_LBUTTONDOWN:
         drawing = True
@@ -32,9 +93,17 @@ def sheet_callback(event, x, y, flags, param):
 
     elif event == cv2.EVENT_MOUSEMOVE and drawing:
         rect_end = (x, y)
-        temp = clone.copy()
-        cv2.rectangle(temp, rect_start, rect_end, (0, 255, 0), 2)
-        cv2.imshow("sheet", temp)
+        restore_preview()
+        cv2.rectangle(preview, rect_start, rect_end, (0, 255, 0), 2)
+        h, w = preview.shape[:2]
+        pad = 2  # rectangle line thickness
+        preview_rect = (
+            max(0, min(rect_start[0], x) - pad),
+            max(0, min(rect_start[1], y) - pad),
+            min(w, max(rect_start[0], x) + pad + 1),
+            min(h, max(rect_start[1], y) + pad + 1),
+        )
+        cv2.imshow("sheet", preview)
 
     elif event == cv2.EVENT_LBUTTONUP:
         drawing = False
@@ -93,26 +162,34 @@ def zoom_callback(event, x, y, flags, param):
         print(f"Zoom click at: ({x}, {y})  -> original coords: ({ox}, {oy})")
 
 
-# Main window settings
+# Main window settings; the window and callback are shared by every sheet
 cv2.namedWindow("sheet", cv2.WINDOW_NORMAL)
 cv2.resizeWindow("sheet", 1200, 1600)
 cv2.setMouseCallback("sheet", sheet_callback)
 
-# Show original image once
-cv2.imshow("sheet", clone)
-
 print("Instructions:")
 print(" - Click once on 'sheet' to print coordinates")
 print(" - Click and drag on 'sheet' to select a rectangle and open zoom")
 print(" - Click inside 'zoom' to get original image coordinates")
 print(" - Press 'r' to reset zoom and close zoom window")
+print(" - Press 'n' to move on to the next sheet")
 print(" - Press ESC to quit")
 
+pending = list(args.images)
+load_sheet(pending.pop(0))
+
+# The sheet is only redrawn from the mouse callbacks, so the loop just waits for
+# keys; a longer timeout lets the thread sleep instead of spinning a core.
 while True:
-    key = cv2.waitKey(1) & 0xFF
+    key = cv2.waitKey(20) & 0xFF
 
     if key == 27:  # ESC
         break
+    elif key == ord('n'):
+        if not pending:
+            print("No more sheets; press ESC to quit.")
+            continue
+        load_sheet(pending.pop(0))
     elif key == ord('r'):
         # Reset zoom
         zoom_img = None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
 import re
 import sys
 import threading
@@ -9,7 +11,7 @@ from typing import List
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
-from desktop.pipeline import DesktopBatchProcessor
+from desktop.pipeline import BatchProcessorConfig, DesktopBatchProcessor, default_worker_count
 from desktop.services.csv_report_generator import CSVReportBatchSummary, CSVReportGenerator
 
 
@@ -54,6 +56,7 @@ class ASETDesktopGUI:
         self.concept_map_path_var = tk.StringVar()
         self.output_parent_path_var = tk.StringVar(value=str(self.output_root))
         self.output_folder_name_var = tk.StringVar(value=f"desktop_run_{datetime.now():%Y%m%d_%H%M%S}")
+        self.worker_count_var = tk.StringVar(value=str(default_worker_count()))
         self.status_var = tk.StringVar(
             value=(
                 "Select scans, CSV, separate Reading/QR/AR keys, concept mapping, "
@@ -184,6 +187,16 @@ class ASETDesktopGUI:
             ),
             variable=self.output_folder_name_var,
         )
+        self._add_text_input_row(
+            form_frame,
+            row_base=24,
+            label_text="Parallel Workers",
+            hint_text=(
+                "Number of students marked at the same time. Each worker uses its own memory; "
+                "lower this on machines with little RAM."
+            ),
+            variable=self.worker_count_var,
+        )
 
         action_frame = ttk.Frame(container, style="App.TFrame")
         action_frame.grid(row=2, column=0, sticky="ew", pady=(4, 4))
@@ -591,6 +604,15 @@ class ASETDesktopGUI:
             return "Output folder name contains invalid characters."
         return ""
 
+    @staticmethod
+    def _validate_worker_count(value: str) -> str:
+        if not value.isdecimal() or int(value) < 1:
+            return "Parallel workers must be a whole number of at least 1."
+        cpu_count = os.cpu_count() or 1
+        if int(value) > cpu_count:
+            return f"Parallel workers cannot exceed the {cpu_count} CPU cores on this machine."
+        return ""
+
     def pick_scans_folder(self) -> None:
         selected = filedialog.askdirectory(title="Select Exam Folder")
         if selected:
@@ -789,6 +811,7 @@ class ASETDesktopGUI:
         output_parent_raw = self.output_parent_path_var.get().strip()
         output_parent_path = Path(output_parent_raw) if output_parent_raw else self.output_root
         output_folder_name = self.output_folder_name_var.get().strip()
+        worker_count_raw = self.worker_count_var.get().strip()
 
         if scans_path is None or not scans_path.exists():
             messagebox.showerror("Invalid Input", "Please select a valid scans directory.")
@@ -822,6 +845,11 @@ class ASETDesktopGUI:
             messagebox.showerror("Invalid Output Name", name_error)
             return
 
+        worker_count_error = self._validate_worker_count(worker_count_raw)
+        if worker_count_error:
+            messagebox.showerror("Invalid Worker Count", worker_count_error)
+            return
+
         try:
             output_parent_path.mkdir(parents=True, exist_ok=True)
         except Exception as exc:
@@ -852,6 +880,7 @@ class ASETDesktopGUI:
                 ar_answer_key_path,
                 concept_map_path,
                 run_output_dir,
+                int(worker_count_raw),
             ),
             daemon=True,
         )
@@ -866,14 +895,18 @@ class ASETDesktopGUI:
         ar_answer_key_path: Path,
         concept_map_path: Path,
         run_output_dir: Path,
+        max_workers: int,
     ) -> None:
         try:
             processor = DesktopBatchProcessor(
-                repo_root=self.repo_root,
-                reading_answer_key_path=reading_answer_key_path,
-                qr_answer_key_path=qr_answer_key_path,
-                ar_answer_key_path=ar_answer_key_path,
-                concept_mapping_path=concept_map_path,
+                BatchProcessorConfig(
+                    repo_root=self.repo_root,
+                    reading_answer_key_path=reading_answer_key_path,
+                    qr_answer_key_path=qr_answer_key_path,
+                    ar_answer_key_path=ar_answer_key_path,
+                    concept_mapping_path=concept_map_path,
+                ),
+                max_workers=max_workers,
             )
             summary = processor.run(scans_path=scans_path, csv_path=csv_path, output_dir=run_output_dir)
             success_count = sum(1 for row in summary.results if row.status == "Success")
@@ -920,4 +953,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Lets the frozen executable act as a worker when the batch marker spawns processes.
+    multiprocessing.freeze_support()
     main()
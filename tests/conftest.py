@@ -1,15 +1,32 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
+
+The web app is imported inside the fixtures that need it, so collecting or
+running the desktop and report tests never pays for importing the app.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
-from fastapi.testclient import TestClient
 
-from web.app import app
-from web.auth import create_session, STAFF_PASSWORD_HASH  # noqa: F401 - imported for completeness
-from web.session_store import MarkingConfiguration, config_store
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+# Minimal valid 1x1 PNG, shared by every test that needs image bytes
+_SAMPLE_PNG = bytes.fromhex(
+    "89504E470D0A1A0A0000000D49484452000000010000000108020000"
+    "00907753DE0000000C4944415408D763F8FFFF3F0005FE02FEDCCC59"
+    "E70000000049454E44AE426082"
+)
 
 
 @pytest.fixture
 def client():
     """Create test client."""
+    from fastapi.testclient import TestClient
+
+    from web.app import app
+
     return TestClient(app)
 
 
@@ -23,6 +40,8 @@ def authenticated_client(client: TestClient) -> TestClient:
 @pytest.fixture
 def configured_client(authenticated_client: TestClient) -> TestClient:
     """Create authenticated and configured test client."""
+    from web.session_store import MarkingConfiguration, config_store
+
     session_token = authenticated_client.cookies.get("session_token")
 
     config = MarkingConfiguration(
@@ -39,79 +58,7 @@ def configured_client(authenticated_client: TestClient) -> TestClient:
     return authenticated_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_png_bytes() -> bytes:
     """Create minimal valid PNG bytes for testing."""
-    return bytes(
-        [
-            0x89,
-            0x50,
-            0x4E,
-            0x47,
-            0x0D,
-            0x0A,
-            0x1A,
-            0x0A,
-            0x00,
-            0x00,
-            0x00,
-            0x0D,
-            0x49,
-            0x48,
-            0x44,
-            0x52,
-            0x00,
-            0x00,
-            0x00,
-            0x01,
-            0x00,
-            0x00,
-            0x00,
-            0x01,
-            0x08,
-            0x02,
-            0x00,
-            0x00,
-            0x00,
-            0x90,
-            0x77,
-            0x53,
-            0xDE,
-            0x00,
-            0x00,
-            0x00,
-            0x0C,
-            0x49,
-            0x44,
-            0x41,
-            0x54,
-            0x08,
-            0xD7,
-            0x63,
-            0xF8,
-            0xFF,
-            0xFF,
-            0x3F,
-            0x00,
-            0x05,
-            0xFE,
-            0x02,
-            0xFE,
-            0xDC,
-            0xCC,
-            0x59,
-            0xE7,
-            0x00,
-            0x00,
-            0x00,
-            0x00,
-            0x49,
-            0x45,
-            0x4E,
-            0x44,
-            0xAE,
-            0x42,
-            0x60,
-            0x82,
-        ]
-    )
+    return _SAMPLE_PNG
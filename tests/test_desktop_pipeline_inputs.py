@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import csv
+from concurrent.futures import Future
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-from desktop.pipeline import DesktopBatchProcessor, EXPECTED_CSV_HEADERS, QUESTIONS_PER_SUBJECT
+import desktop.pipeline as pipeline_module
+from desktop.pipeline import (
+    BatchProcessorConfig,
+    DesktopBatchProcessor,
+    EXPECTED_CSV_HEADERS,
+    QUESTIONS_PER_SUBJECT,
+    StudentInput,
+    StudentRunResult,
+)
 
 
 @pytest.fixture
@@ -258,7 +269,7 @@ def test_run_skips_students_with_missing_writing_or_pdf(tmp_path: Path) -> None:
         type("Student", (), {"name": "Bob Jones", "writing_percent": 77.0, "skip_reason": None})(),
     ]
     processor._collect_merged_docs = lambda scans_path: [tmp_path / "bob.pdf"]
-    processor._match_student_to_doc = lambda student_name, docs: None if student_name == "Bob Jones" else docs[0]
+    processor._match_student_to_doc = lambda student_name, doc_index: None if student_name == "Bob Jones" else doc_index["bob"][0]
 
     summary = processor.run(scans_path=tmp_path, csv_path=tmp_path / "students.csv", output_dir=tmp_path / "out")
 
@@ -267,6 +278,174 @@ def test_run_skips_students_with_missing_writing_or_pdf(tmp_path: Path) -> None:
     assert any("Could not uniquely match merged scan" in issue for issue in summary.issues)
 
 
+def test_match_student_to_doc_prefers_exact_stem(processor: DesktopBatchProcessor) -> None:
+    docs = [Path("Ann Lee.pdf"), Path("Ann Lee-Smith.pdf"), Path("Tom_Ng_scan.pdf")]
+    doc_index = processor._index_docs(docs)
+
+    assert processor._match_student_to_doc("ann lee", doc_index) == Path("Ann Lee.pdf")
+    assert processor._match_student_to_doc("Tom Ng", doc_index) == Path("Tom_Ng_scan.pdf")
+    assert processor._match_student_to_doc("Ann", doc_index) is None
+
+
+class _InlineExecutor:
+    """Stands in for ProcessPoolExecutor and runs each job as soon as it is submitted."""
+
+    created = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        _InlineExecutor.created.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def test_run_marks_students_in_pool_and_keeps_csv_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_worker(student, source_doc, student_output_dir, student_file_stem):
+        if student.name == "Bob Jones":
+            raise RuntimeError("worker crashed")
+        result = StudentRunResult(name=student.name, status="Success", reading_score=30.0)
+        return result, None, [("2026-01-01 09:00:00", f"{student.name} done")]
+
+    _InlineExecutor.created.clear()
+    monkeypatch.setattr(pipeline_module, "ProcessPoolExecutor", _InlineExecutor)
+    monkeypatch.setattr(pipeline_module, "_process_student_in_worker", fake_worker)
+
+    processor = DesktopBatchProcessor.__new__(DesktopBatchProcessor)
+    processor.repo_root = tmp_path
+    processor.config = None
+    processor.max_workers = 2
+    names = ["Alice Smith", "Bob Jones", "Cara Lee"]
+    processor.load_students_csv = lambda csv_path: [StudentInput(name=name, writing_percent=80.0) for name in names]
+    processor._collect_merged_docs = lambda scans_path: [tmp_path / f"{name}.pdf" for name in names]
+    processor._match_student_to_doc = lambda student_name, doc_index: tmp_path / f"{student_name}.pdf"
+
+    output_dir = tmp_path / "out"
+    summary = processor.run(scans_path=tmp_path, csv_path=tmp_path / "students.csv", output_dir=output_dir)
+
+    assert len(_InlineExecutor.created) == 1
+    assert _InlineExecutor.created[0].kwargs["max_workers"] == 2
+    assert _InlineExecutor.created[0].kwargs["mp_context"].get_start_method() == "spawn"
+
+    assert [row.name for row in summary.results] == names
+    assert [row.status for row in summary.results] == ["Success", "Skipped", "Success"]
+    assert summary.issues == ["Bob Jones: worker crashed"]
+    assert "worker crashed" in (output_dir / "Bob Jones" / "debug_error.txt").read_text(encoding="utf-8")
+
+    debug_log = (output_dir / "debug_run.log").read_text(encoding="utf-8")
+    assert "Student 'Cara Lee' queued for marking." in debug_log
+    assert "[2026-01-01 09:00:00] Cara Lee done" in debug_log
+
+    with (output_dir / "batch_summary.csv").open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert [row[0] for row in rows[1:]] == names
+    assert [row[1] for row in rows[1:]] == ["Success", "Skipped", "Success"]
+
+
+class _StubSplitter:
+    def __init__(self, writing_page_pdf=None, error=None):
+        self.writing_page_pdf = writing_page_pdf
+        self.error = error
+
+    def split_document(self, source_doc):
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(
+            reading_page_gray=None,
+            qrar_page_gray=None,
+            writing_page_pdf=self.writing_page_pdf,
+            page_count=2,
+            warnings=["Only 2 pages supplied."],
+        )
+
+
+def _use_worker_processor(monkeypatch: pytest.MonkeyPatch, splitter: _StubSplitter) -> None:
+    worker_processor = DesktopBatchProcessor.__new__(DesktopBatchProcessor)
+    worker_processor.splitter = splitter
+    monkeypatch.setattr(pipeline_module, "_worker_processor", worker_processor)
+
+
+def test_process_student_in_worker_returns_stamped_messages_for_missing_writing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _use_worker_processor(monkeypatch, _StubSplitter(writing_page_pdf=None))
+    student = StudentInput(name="Alice Smith", writing_percent=80.0)
+
+    result, issue, messages = pipeline_module._process_student_in_worker(
+        student, tmp_path / "alice.pdf", tmp_path, "Alice_Smith"
+    )
+
+    assert result.status == "Skipped"
+    assert issue == "Alice Smith: Missing writing page in merged PDF (only 2 pages supplied)."
+    assert [message for _, message in messages] == [
+        f"Student 'Alice Smith' start. Source document: {tmp_path / 'alice.pdf'}",
+        "Student 'Alice Smith' page_count=2",
+        "Student 'Alice Smith' warning: Only 2 pages supplied.",
+        f"Student 'Alice Smith' skipped: {issue}",
+    ]
+    assert all(len(timestamp) == len("2026-01-01 09:00:00") for timestamp, _ in messages)
+
+
+def test_process_student_in_worker_turns_errors_into_skips(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_worker_processor(monkeypatch, _StubSplitter(error=RuntimeError("unreadable scan")))
+    student = StudentInput(name="Alice Smith", writing_percent=80.0)
+
+    result, issue, messages = pipeline_module._process_student_in_worker(
+        student, tmp_path / "alice.pdf", tmp_path, "Alice_Smith"
+    )
+
+    assert result.status == "Skipped"
+    assert result.notes == "unreadable scan"
+    assert issue == "Alice Smith: unreadable scan"
+    assert messages[-1][1].startswith("Student 'Alice Smith' error: unreadable scan")
+    assert "RuntimeError" in (tmp_path / "debug_error.txt").read_text(encoding="utf-8")
+
+
+def test_init_worker_builds_processor_and_preloads_templates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeMarkingService:
+        def __init__(self):
+            self.preloaded = ()
+
+        def preload_templates(self, *template_filenames):
+            self.preloaded = template_filenames
+
+    class FakeProcessor:
+        def __init__(self, config):
+            self.config = config
+            self.marking_service = FakeMarkingService()
+
+    monkeypatch.setattr(pipeline_module, "DesktopBatchProcessor", FakeProcessor)
+    monkeypatch.setattr(pipeline_module, "_worker_processor", None)
+    config = BatchProcessorConfig(
+        repo_root=tmp_path,
+        reading_answer_key_path=tmp_path / "reading.txt",
+        qr_answer_key_path=tmp_path / "qr.txt",
+        ar_answer_key_path=tmp_path / "ar.txt",
+        concept_mapping_path=tmp_path / "concepts.json",
+    )
+
+    pipeline_module._init_worker(config)
+
+    assert isinstance(pipeline_module._worker_processor, FakeProcessor)
+    assert pipeline_module._worker_processor.config is config
+    assert pipeline_module._worker_processor.marking_service.preloaded == (
+        pipeline_module.READING_TEMPLATE_FILENAME,
+        pipeline_module.QRAR_TEMPLATE_FILENAME,
+    )
+
+
 def test_load_concept_mapping_accepts_aliases(tmp_path: Path, processor: DesktopBatchProcessor) -> None:
     concept_path = tmp_path / "concepts.json"
     concept_path.write_text(